@@ -1,8 +1,175 @@
 from PyNite.Node3D import Node3D
 from PyNite.Quad3D import Quad3D
 from PyNite.Plate3D import Plate3D
-from math import pi, sin, cos, ceil, isclose
-from bisect import bisect
+from numpy import array, amax, amin, arange, unique, linspace, concatenate, column_stack, cumsum, meshgrid, full, full_like, sin, cos
+from math import tau, ceil, isclose
+from functools import lru_cache
+from concurrent.futures import ProcessPoolExecutor
+from itertools import repeat
+from os import cpu_count
+
+# Tolerance used for floating point comparisons when generating meshes
+_TOL = 1e-10
+
+# Corner and center sample points for quadrilaterals in the natural (r, s) coordinate system.
+# These are constant for every quad, so they are computed once here rather than per element.
+_QUAD_SAMPLES = ((-1.0, -1.0), (1.0, -1.0), (1.0, 1.0), (-1.0, 1.0), (0.0, 0.0))
+
+@lru_cache()
+def _rect_samples(width, height):
+    """
+    Returns the corner and center sample points for a rectangle of the given dimensions. Cached
+    since the rectangles in a mesh typically share just a few distinct sizes.
+    """
+    return ((0.0, 0.0), (width, 0.0), (width, height), (0.0, height), (width/2, height/2))
+
+# Minimum number of elements before the parallel code path in the extreme-value methods is worth
+# the process startup and pickling overhead
+_PARALLEL_THRESHOLD = 500
+
+def _sample_elements(elements, kind, i, combo):
+    """
+    Samples the 'shear' or 'moment' component `i` at the corners and center of each element for
+    the requested load combination (or all of the element's combinations when `combo` is None).
+    Returns one row of five samples per element/combination pair. This lives at module level so
+    the parallel code path can ship it to worker processes.
+    """
+
+    samples = []
+
+    # Step through each element
+    for element in elements:
+
+        # Determine the sample points for the element. Quads use a constant set of points in the
+        # natural (r, s) coordinate system, while rectangles use their local (x, y) coordinate
+        # system and depend on the element's dimensions.
+        if element.type == 'Quad':
+            sample_points = _QUAD_SAMPLES
+        else:
+            sample_points = _rect_samples(element.width(), element.height())
+
+        # Bind the sampling method once per element to keep attribute lookups out of the hot loop
+        get_samples = element.shear_samples if kind == 'shear' else element.moment_samples
+
+        # When a specific load combination was requested, look it up directly rather than
+        # scanning every load combination the element utilizes
+        if combo == None:
+            load_combos = element.LoadCombos.values()
+        elif combo in element.LoadCombos:
+            load_combos = [element.LoadCombos[combo]]
+        else:
+            load_combos = []
+
+        # Step through each load combination to be evaluated
+        for load_combo in load_combos:
+
+            # Sample at each corner and the center of the element in a single call, so the
+            # element computes its combination-dependent terms only once
+            samples.append(get_samples(sample_points, load_combo.name)[:, i])
+
+    return samples
+
+def _mesh_samples(elements, kind, i, combo, parallel):
+    """
+    Gathers the shear or moment samples for all the elements in a mesh, splitting the work
+    across processes when `parallel` is requested and the mesh is large enough for the process
+    startup and pickling overhead to pay off.
+    """
+
+    element_list = list(elements.values())
+
+    if parallel and len(element_list) >= _PARALLEL_THRESHOLD:
+        # Deal the elements into one chunk per processor and reduce the chunks in parallel
+        n_chunks = cpu_count() or 1
+        chunks = [element_list[j::n_chunks] for j in range(n_chunks)]
+        with ProcessPoolExecutor() as pool:
+            chunk_samples = pool.map(_sample_elements, chunks, repeat(kind), repeat(i),
+                                     repeat(combo))
+        return [row for chunk in chunk_samples for row in chunk]
+    else:
+        return _sample_elements(element_list, kind, i, combo)
+
+
+@lru_cache()
+def _trans_ring_connectivity(n):
+    """
+    Returns the `(i_node, j_node, m_node, n_node)` connectivity for each of the `4*n` elements in
+    a transition ring of `n` inner quads, as 1-based local node numbers. The table only depends
+    on `n`, so it's cached for reuse across rings of the same density.
+    """
+
+    conn = []
+    for i in range(1, 4*n + 1, 1):
+
+        if i <= n:
+            n_node = i
+            j_node = 2*i + n
+            i_node = 2*i + n - 1
+            if i != n:
+                m_node = i + 1
+            else:
+                m_node = 1
+        elif (i - n) % 3 == 1:
+            n_node = 1 + (i - (n + 1))//3
+            m_node = i - (i - (n + 1))//3
+            j_node = i + 2*n + 1
+            i_node = i + 2*n
+        elif (i - n) % 3 == 2:
+            n_node = i - 1 - (i - (n + 1))//3
+            m_node = i - (i - (n + 1))//3
+            j_node = i + 2*n + 1
+            i_node = i + 2*n
+        else:
+            n_node = i - 1 - (i - (n + 1))//3
+            i_node = i + 2*n
+            if i != 4*n:
+                m_node = 2 + (i - (n + 1))//3
+                j_node = i + 2*n + 1
+            else:
+                m_node = 1
+                j_node = 1 + 3*n
+
+        conn.append((i_node, j_node, m_node, n_node))
+
+    return tuple(conn)
+
+
+# Maps a global axis of revolution to the component (cosine-radial, sine-radial or axial) that
+# feeds each of the global X, Y and Z coordinates of a revolved ring of nodes
+_AXIS_COMPONENTS = {'Y': ('cos', 'axial', 'sin'),
+                    'X': ('axial', 'sin', 'cos'),
+                    'Z': ('sin', 'cos', 'axial')}
+
+@lru_cache()
+def _ring_trig(n, theta):
+    """
+    Returns the cosine and sine arrays for `n` node positions spaced `theta` apart around a ring.
+
+    Every vertical slice of a cylinder, and every equal-density ring of an annulus, shares the
+    same angles, so the trig arrays are cached rather than recomputed per ring.
+    """
+
+    angles = arange(n)*theta
+    return cos(angles), sin(angles)
+
+def _ring_coords(n, theta, axis, Xo, Yo, Zo, r1, r2, h1=0.0, h2=0.0):
+    """
+    Computes the node coordinates for a revolved ring of `2*n` nodes as three arrays.
+
+    The first `n` nodes lie at radius `r1`, offset `h1` along the axis of revolution from the
+    origin, and the remaining `n` nodes at radius `r2`, offset `h2`. The two sets of nodes share
+    the same angles, so the trig values are computed once. The axis must already be validated by
+    the caller.
+    """
+
+    cos_a, sin_a = _ring_trig(n, theta)
+
+    components = {'cos': concatenate((r1*cos_a, r2*cos_a)),
+                  'sin': concatenate((r1*sin_a, r2*sin_a)),
+                  'axial': concatenate((full(n, h1), full(n, h2)))}
+    cx, cy, cz = _AXIS_COMPONENTS[axis]
+
+    return Xo + components[cx], Yo + components[cy], Zo + components[cz]
 
 #%%
 class Mesh():
@@ -24,7 +191,47 @@ class Mesh():
         self.nodes = {}                     # A dictionary containing the nodes in the mesh
         self.elements = {}                  # A dictionary containing the elements in the mesh
     
-    def max_shear(self, direction='Qx', combo=None):
+    def _extremum(self, kind, direction, combo, op, parallel):
+        """
+        Returns the extreme shear or moment in the mesh. This is the shared implementation
+        behind the four public extreme-value methods.
+
+        Parameters
+        ----------
+        kind : string
+            The result to sample: 'shear' or 'moment'.
+        direction : string
+            The component to get the extreme value for: 'Qx' or 'Qy' for shears, 'Mx', 'My' or
+            'Mxy' for moments.
+        combo : string
+            The name of the load combination to evaluate, or None for all load combinations.
+        op : callable
+            The reduction that picks the extreme value: `amax` or `amin`.
+        parallel : boolean
+            Whether to sample large meshes across multiple processes.
+        """
+
+        # Map the requested direction to a result component index
+        try:
+            i = {'shear': {'Qx': 0, 'Qy': 1},
+                 'moment': {'Mx': 0, 'My': 1, 'Mxy': 2}}[kind][direction]
+        except KeyError:
+            if kind == 'shear':
+                raise Exception('Invalid direction specified for mesh shear results. Valid values are \'Qx\', or \'Qy\'')
+            else:
+                raise Exception('Invalid direction specified for mesh moment results. Valid values are \'Mx\', \'My\', or \'Mxy\'')
+
+        # Gather the samples from every element into rows of a single array so the extreme value
+        # can be found with one C-level reduction instead of per-sample Python comparisons
+        samples = _mesh_samples(self.elements, kind, i, combo, parallel)
+
+        # Return the extreme value encountered from all the elements
+        if samples == []:
+            return None
+        else:
+            return op(samples)
+
+    def max_shear(self, direction='Qx', combo=None, parallel=False):
         """
         Returns the maximum shear in the mesh.
         
@@ -39,58 +246,14 @@ class Mesh():
         combo : string, optional
             The name of the load combination to get the maximum shear for. If omitted, all load
             combinations will be evaluated.
+        parallel : boolean, optional
+            If set to `True` large meshes will be sampled across multiple processes. The default
+            is `False` since the process startup overhead outweighs the gain on small meshes.
         """
 
-        if direction == 'Qx':
-            i = 0
-        elif direction == 'Qy':
-            i = 1
-        else:
-            raise Exception('Invalid direction specified for mesh shear results. Valid values are \'Qx\', or \'Qy\'')
-
-        # Initialize the maximum value to None
-        Q_max = None
-
-        # Step through each element in the mesh
-        for element in self.elements.values():
-
-            # Determine whether the element is a rectangle or a quadrilateral
-            if element.type == 'Rect':
-                # Use the rectangle's local (x, y) coordinate system
-                xi, yi = 0, 0
-                xj, yj = element.width(), 0
-                xm, ym = element.width(), element.height()
-                xn, yn, = 0, element.height()
-            elif element.type == 'Quad':
-                # Use the quad's natural (r, s) coordinate system
-                xi, yi = -1, -1
-                xj, yj = 1, -1
-                xm, ym = 1, 1
-                xn, yn = -1, 1
-
-            # Step through each load combination the element utilizes
-            for load_combo in element.LoadCombos.values():
-
-                # Determine if this load combination should be evaluated
-                if combo == None or load_combo.name == combo:
-                    
-                    # Find the maximum shear in the element, checking each corner and the center
-                    # of the element
-                    Q_element = max([element.shear(xi, yi, load_combo.name)[i, 0],
-                                     element.shear(xj, yj, load_combo.name)[i, 0],
-                                     element.shear(xm, ym, load_combo.name)[i, 0],
-                                     element.shear(xn, yn, load_combo.name)[i, 0],
-                                     element.shear((xi + xj)/2, (yi + yn)/2, load_combo.name)[i, 0]])
-
-                    # Determine if the maximum shear calculated is the largest encountered so far
-                    if Q_max == None or Q_max < Q_element:
-                        # Save this value if it's the largest
-                        Q_max = Q_element
-            
-        # Return the largest value encountered from all the elements
-        return Q_max
+        return self._extremum('shear', direction, combo, amax, parallel)
     
-    def min_shear(self, direction='Qx', combo=None):
+    def min_shear(self, direction='Qx', combo=None, parallel=False):
         """
         Returns the minimum shear in the mesh.
         
@@ -105,58 +268,14 @@ class Mesh():
         combo : string, optional
             The name of the load combination to get the minimum shear for. If omitted, all load
             combinations will be evaluated.
+        parallel : boolean, optional
+            If set to `True` large meshes will be sampled across multiple processes. The default
+            is `False` since the process startup overhead outweighs the gain on small meshes.
         """
 
-        if direction == 'Qx':
-            i = 0
-        elif direction == 'Qy':
-            i = 1
-        else:
-            raise Exception('Invalid direction specified for mesh shear results. Valid values are \'Qx\', or \'Qy\'')
-
-        # Initialize the minimum value to None
-        Q_min = None
+        return self._extremum('shear', direction, combo, amin, parallel)
 
-        # Step through each element in the mesh
-        for element in self.elements.values():
-
-            # Determine whether the element is a rectangle or a quadrilateral
-            if element.type == 'Rect':
-                # Use the rectangle's local (x, y) coordinate system
-                xi, yi = 0, 0
-                xj, yj = element.width(), 0
-                xm, ym = element.width(), element.height()
-                xn, yn, = 0, element.height()
-            elif element.type == 'Quad':
-                # Use the quad's natural (r, s) coordinate system
-                xi, yi = -1, -1
-                xj, yj = 1, -1
-                xm, ym = 1, 1
-                xn, yn = -1, 1
-
-            # Step through each load combination the element utilizes
-            for load_combo in element.LoadCombos.values():
-
-                # Determine if this load combination should be evaluated
-                if combo == None or load_combo.name == combo:
-                    
-                    # Find the minimum shear in the element, checking each corner and the center
-                    # of the element
-                    Q_element = min([element.shear(xi, yi, load_combo.name)[i, 0],
-                                     element.shear(xj, yj, load_combo.name)[i, 0],
-                                     element.shear(xm, ym, load_combo.name)[i, 0],
-                                     element.shear(xn, yn, load_combo.name)[i, 0],
-                                     element.shear((xi + xj)/2, (yi + yn)/2, load_combo.name)[i, 0]])
-
-                    # Determine if the minimum shear calculated is the smallest encountered so far
-                    if Q_min == None or Q_min > Q_element:
-                        # Save this value if it's the smallest
-                        Q_min = Q_element
-            
-        # Return the smallest value encountered from all the elements
-        return Q_min
-
-    def max_moment(self, direction='Mx', combo=None):
+    def max_moment(self, direction='Mx', combo=None, parallel=False):
         """
         Returns the maximum moment in the mesh.
         
@@ -171,60 +290,14 @@ class Mesh():
         combo : string, optional
             The name of the load combination to get the maximum moment for. If omitted, all load
             combinations will be evaluated.
+        parallel : boolean, optional
+            If set to `True` large meshes will be sampled across multiple processes. The default
+            is `False` since the process startup overhead outweighs the gain on small meshes.
         """
 
-        if direction == 'Mx':
-            i = 0
-        elif direction == 'My':
-            i = 1
-        elif direction == 'Mxy':
-            i = 2
-        else:
-            raise Exception('Invalid direction specified for mesh moment results. Valid values are \'Mx\', \'My\', or \'Mxy\'')
-
-        # Initialize the maximum value to None
-        M_max = None
-
-        # Step through each element in the mesh
-        for element in self.elements.values():
-
-            # Determine whether the element is a rectangle or a quadrilateral
-            if element.type == 'Rect':
-                # Use the rectangle's local (x, y) coordinate system
-                xi, yi = 0, 0
-                xj, yj = element.width(), 0
-                xm, ym = element.width(), element.height()
-                xn, yn, = 0, element.height()
-            elif element.type == 'Quad':
-                # Use the quad's natural (r, s) coordinate system
-                xi, yi = -1, -1
-                xj, yj = 1, -1
-                xm, ym = 1, 1
-                xn, yn = -1, 1
-
-            # Step through each load combination the element utilizes
-            for load_combo in element.LoadCombos.values():
-
-                # Determine if this load combination should be evaluated
-                if combo == None or load_combo.name == combo:
-                    
-                    # Find the maximum moment in the element, checking each corner and the center
-                    # of the element
-                    M_element = max([element.moment(xi, yi, load_combo.name)[i, 0],
-                                     element.moment(xj, yj, load_combo.name)[i, 0],
-                                     element.moment(xm, ym, load_combo.name)[i, 0],
-                                     element.moment(xn, yn, load_combo.name)[i, 0],
-                                     element.moment((xi + xj)/2, (yi + yn)/2, load_combo.name)[i, 0]])
-
-                    # Determine if the maximum moment calculated is the largest encountered so far
-                    if M_max == None or M_max < M_element:
-                        # Save this value if it's the largest
-                        M_max = M_element
-            
-        # Return the largest value encountered from all the elements
-        return M_max
+        return self._extremum('moment', direction, combo, amax, parallel)
     
-    def min_moment(self, direction='Mx', combo=None):
+    def min_moment(self, direction='Mx', combo=None, parallel=False):
         """
         Returns the minimum moment in the mesh.
         
@@ -239,58 +312,12 @@ class Mesh():
         combo : string, optional
             The name of the load combination to get the minimum moment for. If omitted, all load
             combinations will be evaluated.
+        parallel : boolean, optional
+            If set to `True` large meshes will be sampled across multiple processes. The default
+            is `False` since the process startup overhead outweighs the gain on small meshes.
         """
 
-        if direction == 'Mx':
-            i = 0
-        elif direction == 'My':
-            i = 1
-        elif direction == 'Mxy':
-            i = 2
-        else:
-            raise Exception('Invalid direction specified for mesh moment results. Valid values are \'Mx\', \'My\', or \'Mxy\'')
-
-        # Initialize the minimum value to None
-        M_min = None
-
-        # Step through each element in the mesh
-        for element in self.elements.values():
-
-            # Determine whether the element is a rectangle or a quadrilateral
-            if element.type == 'Rect':
-                # Use the rectangle's local (x, y) coordinate system
-                xi, yi = 0, 0
-                xj, yj = element.width(), 0
-                xm, ym = element.width(), element.height()
-                xn, yn, = 0, element.height()
-            elif element.type == 'Quad':
-                # Use the quad's natural (r, s) coordinate system
-                xi, yi = -1, -1
-                xj, yj = 1, -1
-                xm, ym = 1, 1
-                xn, yn = -1, 1
-
-            # Step through each load combination the element utilizes
-            for load_combo in element.LoadCombos.values():
-
-                # Determine if this load combination should be evaluated
-                if combo == None or load_combo.name == combo:
-                    
-                    # Find the minimum moment in the element, checking each corner and the center
-                    # of the element
-                    M_element = min([element.moment(xi, yi, load_combo.name)[i, 0],
-                                     element.moment(xj, yj, load_combo.name)[i, 0],
-                                     element.moment(xm, ym, load_combo.name)[i, 0],
-                                     element.moment(xn, yn, load_combo.name)[i, 0],
-                                     element.moment((xi + xj)/2, (yi + yn)/2, load_combo.name)[i, 0]])
-
-                    # Determine if the minimum moment calculated is the smallest encountered so far
-                    if M_min == None or M_min > M_element:
-                        # Save this value if it's the smallest
-                        M_min = M_element
-            
-        # Return the smallest value encountered from all the elements
-        return M_min
+        return self._extremum('moment', direction, combo, amin, parallel)
     
 #%%
 class RectangleMesh(Mesh):
@@ -365,19 +392,16 @@ class RectangleMesh(Mesh):
         Yo = self.origin[1]
         Zo = self.origin[2]
         plane = self.plane
-        x_control = self.x_control
-        y_control = self.y_control
         element_type = self.element_type
 
-        # Add the mesh's boundaries to the list of control points
-        x_control.append(0)
-        x_control.append(width)
-        y_control.append(0)
-        y_control.append(height)
+        # Add the mesh's boundaries to copies of the control point lists. Working on copies keeps
+        # repeated calls to `generate` from growing the lists stored on the mesh.
+        x_control = list(self.x_control) + [0, width]
+        y_control = list(self.y_control) + [0, height]
 
-        # Sort the control points and remove duplicate values
-        x_control = sorted(set(x_control))
-        y_control = sorted(set(y_control))
+        # Sort the control points and remove duplicate values in one C-level pass
+        x_control = unique(x_control)
+        y_control = unique(y_control)
         
         # Each node number will be increased by the offset calculated below
         node_offset = int(self.start_node[1:]) - 1
@@ -393,191 +417,173 @@ class RectangleMesh(Mesh):
         else:
             raise Exception('Invalid element type specified for RectangleMesh. Select \'Quad\' or \'Rect\'.')
 
-        # Initialize node numbering
-        node_num = 1
-
-        # Step through each y control point (except the first one which is always zero)
-        num_rows = 0
-        num_cols = 0
-        y, h = 0, None
+        # Build the array of node positions along the mesh's local x-axis. Each span between
+        # control points is subdivided into segments no longer than the mesh size. The first point
+        # of each span after the first is dropped since it duplicates the previous span's endpoint.
+        x_vals = [array([x_control[0]])]
+        for i in range(1, len(x_control), 1):
+            nx = max(1, (x_control[i] - x_control[i - 1])/mesh_size)
+            x_vals.append(linspace(x_control[i - 1], x_control[i], ceil(nx) + 1)[1:])
+        x_vals = concatenate(x_vals)
+
+        # Build the array of node positions along the mesh's local y-axis the same way
+        y_vals = [array([y_control[0]])]
         for j in range(1, len(y_control), 1):
-            
-            # If this is not the first iteration 'y' will be too high at this point.
-            if j != 1:
-                y -= h
-
-            # Determine the mesh size between this y control point and the previous one
             ny = max(1, (y_control[j] - y_control[j - 1])/mesh_size)
-            h = (y_control[j] - y_control[j - 1])/ceil(ny)
-
-            # Adjust 'y' if this is not the first iteration.
-            if j != 1:
-                y += h
-
-            # Generate nodes between the y control points
-            while round(y, 10) <= round(y_control[j], 10):
-                
-                # Count the number of rows of plates as we go
-                num_rows += 1
-
-                # Step through each x control point (except the first one which is always zero)
-                x, b = 0, None
-                for i in range(1, len(x_control), 1):
-                    
-                    # 'x' needs to be adjusted for the same reasons 'y' needed to be adjusted
-                    if i != 1:
-                        x -= b
-
-                    # Determine the mesh size between this x control point and the previous one
-                    nx = max(1, (x_control[i] - x_control[i - 1])/mesh_size)
-                    b = (x_control[i] - x_control[i - 1])/ceil(nx)
-
-                    if i != 1:
-                        x += b
-
-                    # Generate nodes between the x control points
-                    while round(x, 10) <= round(x_control[i], 10):
-                        
-                        # Count the number of columns of plates as we go
-                        if y == 0:
-                            num_cols += 1
-
-                        # Assign the node a name
-                        node_name = 'N' + str(node_num + node_offset)
-
-                        # Calculate the node's coordinates
-                        if plane == 'XY':
-                            X = Xo + x
-                            Y = Yo + y
-                            Z = Zo + 0
-                        elif plane == 'YZ':
-                            X = Xo + 0
-                            Y = Yo + y
-                            Z = Zo + x
-                        elif plane == 'XZ':
-                            X = Xo + x
-                            Y = Yo + 0
-                            Z = Zo + y
-                        else:
-                            raise Exception('Invalid plane selected for RectangleMesh.')
-
-                        # Add the node to the mesh
-                        self.nodes[node_name] = Node3D(node_name, X, Y, Z)
-
-                        # Move to the next x coordinate
-                        x += b
-
-                        # Move to the next node number
-                        node_num += 1
-
-                # Move to the next y coordinate
-                y += h
-        
-        # At this point `num_cols` and `num_rows` represent the number of columns and rows of
-        # nodes. We'll adjust these variables to be the number of columns and rows of elements
-        # instead.
-        num_cols -= 1
-        num_rows -= 1
+            y_vals.append(linspace(y_control[j - 1], y_control[j], ceil(ny) + 1)[1:])
+        y_vals = concatenate(y_vals)
+
+        # Generate the full grid of local node coordinates, row by row
+        x_grid, y_grid = meshgrid(x_vals, y_vals)
+        x_grid = x_grid.ravel()
+        y_grid = y_grid.ravel()
+
+        # Convert the local coordinates to global coordinates. The plane only needs to be checked
+        # once for the entire grid.
+        if plane == 'XY':
+            X = Xo + x_grid
+            Y = Yo + y_grid
+            Z = full_like(x_grid, Zo)
+        elif plane == 'YZ':
+            X = full_like(x_grid, Xo)
+            Y = Yo + y_grid
+            Z = Zo + x_grid
+        elif plane == 'XZ':
+            X = Xo + x_grid
+            Y = full_like(x_grid, Yo)
+            Z = Zo + y_grid
+        else:
+            raise Exception('Invalid plane selected for RectangleMesh.')
+
+        # Generate all the node names up front, then stream the new nodes straight into the
+        # dictionary
+        node_names = [f'N{num}' for num in range(node_offset + 1, node_offset + x_grid.size + 1)]
+        self.nodes = {name: Node3D(name, X_node, Y_node, Z_node)
+                      for name, X_node, Y_node, Z_node in zip(node_names, X, Y, Z)}
+
+        # Determine the number of columns and rows of elements
+        num_cols = len(x_vals) - 1
+        num_rows = len(y_vals) - 1
         
+        # Compute the i-node index of every element with integer index arithmetic rather than
+        # per-element row/column counters. The remaining corner indices follow by constant offsets
+        # since the nodes are numbered row by row.
+        rows = arange(num_rows)
+        cols = arange(num_cols)
+        i_indices = (rows[:, None]*(num_cols + 1) + cols[None, :] + 1).ravel()
+
         # Create the elements
-        r = 1
-        n = 1
-        for i in range(1, num_cols*num_rows + 1, 1):
+        for i, i_node in enumerate(i_indices):
 
             # Assign the element a name
-            element_name = element_prefix + str(i + element_offset)
+            element_name = element_prefix + str(i + 1 + element_offset)
 
             # Find the attached nodes
-            i_node = n + (r - 1)
             j_node = i_node + 1
             m_node = j_node + (num_cols + 1)
             n_node = m_node - 1
 
-            if i % num_cols == 0:
-                r += 1
-            
-            n += 1
-            
             if element_type == 'Quad':
-                self.elements[element_name] = Quad3D(element_name, self.nodes['N' + str(i_node + node_offset)],
-                                                                   self.nodes['N' + str(j_node + node_offset)],
-                                                                   self.nodes['N' + str(m_node + node_offset)],
-                                                                   self.nodes['N' + str(n_node + node_offset)],
+                self.elements[element_name] = Quad3D(element_name, self.nodes[node_names[i_node - 1]],
+                                                                   self.nodes[node_names[j_node - 1]],
+                                                                   self.nodes[node_names[m_node - 1]],
+                                                                   self.nodes[node_names[n_node - 1]],
                                                                    self.t, self.E, self.nu, self.kx_mod, self.ky_mod)
             else:
-                self.elements[element_name] = Plate3D(element_name, self.nodes['N' + str(i_node + node_offset)],
-                                                                    self.nodes['N' + str(j_node + node_offset)],
-                                                                    self.nodes['N' + str(m_node + node_offset)],
-                                                                    self.nodes['N' + str(n_node + node_offset)],
+                self.elements[element_name] = Plate3D(element_name, self.nodes[node_names[i_node - 1]],
+                                                                    self.nodes[node_names[j_node - 1]],
+                                                                    self.nodes[node_names[m_node - 1]],
+                                                                    self.nodes[node_names[n_node - 1]],
                                                                     self.t, self.E, self.nu, self.kx_mod, self.ky_mod)
 
-        # Initialize a list of nodes and associated elements that fall within
+        # Initialize a set of nodes and associated elements that fall within
         # opening boundaries that will be deleted
-        node_del_list = []
-        element_del_list = []
-
-        # Go back through the mesh and delete any nodes that are in the openings
-        for node in self.nodes.values():
-            
-            # Get the node's position in the mesh's local coordinate sytem.
-            x, y = self.node_local_coords(node)
-
-            # Step through each opening in the mesh
-            for opng in self.openings.values():
-
-                # Determine if the node falls within the boundaries of the opening
-                if (round(x, 10) > round(opng.x_left, 10)
-                and round(x, 10) < round(opng.x_left + opng.width, 10) 
-                and round(y, 10) > round(opng.y_bott, 10) 
-                and round(y, 10) < round(opng.y_bott + opng.height, 10)):
-
-                    # Mark the node for deletion if it's not already marked
-                    if node.Name not in node_del_list:
-                        node_del_list.append(node.Name)
-                
-        # Go back through the mesh and delete any elements that are in the openings
+        node_del_list = set()
+        element_del_list = set()
+
+        if self.openings != {}:
+
+            # Stack the opening boundaries into a single array of rows of
+            # [x_left, x_right, y_bott, y_top]
+            opng_bounds = array([[opng.x_left, opng.x_left + opng.width,
+                                  opng.y_bott, opng.y_bott + opng.height]
+                                 for opng in self.openings.values()])
+
+            # Get every node's position in the mesh's local coordinate sytem
+            node_list = list(self.nodes.values())
+            node_coords = self._local_coords_array(node_list)
+
+            # Find the nodes that fall within the boundaries of any opening with one broadcast
+            # comparison against all the openings at once
+            inside = ((node_coords[:, 0:1] > opng_bounds[:, 0] + _TOL)
+                      & (node_coords[:, 0:1] < opng_bounds[:, 1] - _TOL)
+                      & (node_coords[:, 1:2] > opng_bounds[:, 2] + _TOL)
+                      & (node_coords[:, 1:2] < opng_bounds[:, 3] - _TOL)).any(axis=1)
+
+            # Mark the nodes for deletion
+            node_del_list = {node.Name for node, in_opng in zip(node_list, inside) if in_opng}
+
+            # Find the top, bottom, left side and right side of each element in local coordinates
+            element_list = list(self.elements.values())
+            nw_coords = self._local_coords_array([element.n_node for element in element_list])
+            se_coords = self._local_coords_array([element.j_node for element in element_list])
+
+            # Find the elements that fall within the boundaries of any opening the same way
+            inside = ((opng_bounds[:, 3] >= nw_coords[:, 1:2] - _TOL)
+                      & (opng_bounds[:, 2] <= se_coords[:, 1:2] + _TOL)
+                      & (opng_bounds[:, 0] <= nw_coords[:, 0:1] + _TOL)
+                      & (opng_bounds[:, 1] >= se_coords[:, 0:1] - _TOL)).any(axis=1)
+
+            # Mark the elements for deletion
+            element_del_list = {element.Name for element, in_opng
+                                in zip(element_list, inside) if in_opng}
+
+        # Rebuild the dictionaries once without the items marked for deletion, rather than
+        # deleting keys one at a time
+        if element_del_list:
+            self.elements = {name: element for name, element in self.elements.items()
+                             if name not in element_del_list}
+        if node_del_list:
+            self.nodes = {name: node for name, node in self.nodes.items()
+                          if name not in node_del_list}
+
+        # Find any remaining orphaned nodes around the perimeter of the mesh. A single pass over
+        # the elements builds the set of nodes still in use, rather than rescanning every element
+        # for every node.
+        referenced_nodes = set()
         for element in self.elements.values():
+            referenced_nodes.add(element.i_node.Name)
+            referenced_nodes.add(element.j_node.Name)
+            referenced_nodes.add(element.m_node.Name)
+            referenced_nodes.add(element.n_node.Name)
 
-            # Find the top, bottom, left side and right side of the element in local coordinates
-            left, top = self.node_local_coords(element.n_node)
-            right, bott = self.node_local_coords(element.j_node)
+        # Rebuild the node dictionary once more, keeping only the nodes still in use
+        self.nodes = {name: node for name, node in self.nodes.items()
+                      if name in referenced_nodes}
 
-            for opng in self.openings.values():
-
-                # Determine if the element falls within the boundaries of the opening
-                if ((round(opng.y_bott + opng.height, 10) >= round(top, 10))
-                and (round(opng.y_bott, 10) <= round(bott, 10))
-                and (round(opng.x_left, 10) <= round(left, 10))
-                and (round(opng.x_left + opng.width, 10) >= round(right, 10))):
+        # Identify the last node and last element in the mesh
+        self.last_node = list(self.nodes.values())[-1]
+        self.last_element = list(self.elements.values())[-1]
 
-                    # Mark the element for deletion if it's not already marked
-                    if element.Name not in element_del_list:
-                        element_del_list.append(element.Name)
+    def _local_coords_array(self, nodes):
+        """
+        Calculates the positions of a group of nodes in the mesh's local coordinate system.
 
-        # Delete the elements marked for deletion
-        for element_name in element_del_list:
-            del self.elements[element_name]
+        Evaluates the plane branch once for the whole group and returns an (N, 2) array of local
+        (x, y) coordinates, one row per node.
+        """
 
-        # Delete the nodes marked for deletion
-        for node_name in node_del_list:
-            del self.nodes[node_name]
-        
-        # Find any remaining orphaned nodes around the perimeter of the mesh
-        node_del_list = []
-        for node in self.nodes.values():
-            if (node not in [element.i_node for element in self.elements.values()]
-            and node not in [element.j_node for element in self.elements.values()]
-            and node not in [element.m_node for element in self.elements.values()]
-            and node not in [element.n_node for element in self.elements.values()]):
-                node_del_list.append(node.Name)
-        
-        # Delete the orphaned nodes
-        for node_name in node_del_list:
-            del self.nodes[node_name]
+        if self.plane == 'XY':
+            x = array([node.X for node in nodes]) - self.origin[0]
+            y = array([node.Y for node in nodes]) - self.origin[1]
+        elif self.plane == 'YZ':
+            x = array([node.Z for node in nodes]) - self.origin[2]
+            y = array([node.Y for node in nodes]) - self.origin[1]
+        elif self.plane == 'XZ':
+            x = array([node.X for node in nodes]) - self.origin[0]
+            y = array([node.Z for node in nodes]) - self.origin[2]
 
-        # Identify the last node and last element in the mesh
-        self.last_node = list(self.nodes.values())[-1]
-        self.last_element = list(self.elements.values())[-1]
+        return column_stack((x, y))
 
     def node_local_coords(self, node):
         """
@@ -650,6 +656,39 @@ class RectOpening():
         self.width = width
         self.height = height
 
+#%%
+def _plan_rings(mesh_size, r_inner, r_outer, n_circ):
+    """
+    Plans the rings an annular mesh will be built from.
+
+    Returns a list of (r_inner, h_rad, n_circ, transition) tuples, one per ring, working from
+    the inside of the annulus toward the outside. Keeping the scheduling arithmetic in its own
+    tight loop separates it from the ring construction work in `AnnulusMesh._generate`.
+    """
+
+    rings = []
+
+    while r_inner < r_outer - _TOL:
+
+        radial = r_outer - r_inner                    # Remaining length in the radial direction to be meshed
+        circumf = tau*r_inner                        # Circumference of the ring at the inner radius
+        b_circ = circumf/n_circ                       # Element width in the circumferential direction
+        n_rad = int(radial/min(mesh_size, 3*b_circ))  # Number of times the plate width fits in the remaining unmeshed radial direction
+        h_rad = radial/n_rad                          # Element height in the radial direction
+
+        # Determine if the mesh is getting too big. If so the mesh will need to transition to a
+        # finer mesh.
+        transition = b_circ > 3*mesh_size
+
+        rings.append((r_inner, h_rad, n_circ, transition))
+
+        # Prepare to move to the next ring
+        if transition:
+            n_circ *= 3
+        r_inner += h_rad
+
+    return rings
+
 #%%           
 class AnnulusMesh(Mesh):
     """
@@ -686,58 +725,39 @@ class AnnulusMesh(Mesh):
         n = int(self.start_node[1:])
         q = int(self.start_element[1:])
 
-        circumf = 2*pi*r_inner                                 # Circumference of the ring at the inner radius
+        circumf = tau*r_inner                                 # Circumference of the ring at the inner radius
         n_circ = int(circumf/mesh_size)  # Number of times `mesh_size` fits in the circumference
         self.num_quads_outer = n_circ
 
-        # Mesh the annulus from the inside toward the outside
-        while round(r_inner, 10) < round(r_outer, 10):
-            
-            radial = r_outer - r_inner                    # Remaining length in the radial direction to be meshed
-            circumf = 2*pi*r_inner                        # Circumference of the ring at the inner radius
-            b_circ = circumf/n_circ                       # Element width in the circumferential direction
-            n_rad = int(radial/min(mesh_size, 3*b_circ))  # Number of times the plate width fits in the remaining unmeshed radial direction
-            h_rad = radial/n_rad                          # Element height in the radial direction
-
-            # Determine if the mesh is getting too big. If so the mesh will need to transition to a
-            # finer mesh.
-            if b_circ > 3*mesh_size:
-                transition = True
-            else:
-                transition = False
-        
+        # Plan the radius, height and mesh density of every ring up front, then mesh the annulus
+        # from the inside toward the outside. Each ring reuses the previous ring's outer nodes as
+        # its inner nodes, so shared boundary nodes are only ever created once.
+        outer_nodes = None
+        for r_ring, h_rad, n_circ, transition in _plan_rings(mesh_size, r_inner, r_outer, n_circ):
+
             # Create a mesh of nodes for the ring
             if transition == True:
-                ring = AnnulusTransRingMesh(r_inner + h_rad, r_inner, n_circ, t, E, nu, kx_mod, ky_mod,
-                                            self.origin, self.axis, 'N' + str(n), 'Q' + str(q))
+                ring = AnnulusTransRingMesh(r_ring + h_rad, r_ring, n_circ, t, E, nu, kx_mod, ky_mod,
+                                            self.origin, self.axis, f'N{n}', f'Q{q}',
+                                            inner_nodes=outer_nodes)
                 n += 3*n_circ
                 q += 4*n_circ
-                n_circ *= 3
-                self.num_quads_outer = n_circ
+                self.num_quads_outer = n_circ*3
+                num_outer = 3*n_circ
             else:
-                ring = AnnulusRingMesh(r_inner + h_rad, r_inner, n_circ, t, E, nu, kx_mod, ky_mod, self.origin,
-                                       self.axis, 'N' + str(n), 'Q' + str(q))
+                ring = AnnulusRingMesh(r_ring + h_rad, r_ring, n_circ, t, E, nu, kx_mod, ky_mod, self.origin,
+                                       self.axis, f'N{n}', f'Q{q}',
+                                       inner_nodes=outer_nodes)
                 n += n_circ
                 q += n_circ
+                num_outer = n_circ
         
-            # Add the newly generated nodes and elements to the overall mesh. Note that if duplicate
-            # keys exist, the `.update()` method will overwrite them with the newly generated key value
-            # pairs. This works in our favor by automatically eliminating duplicate nodes from the
-            # dictionary.
+            # Add the newly generated nodes and elements to the overall mesh
             self.nodes.update(ring.nodes)
             self.elements.update(ring.elements)
 
-            # Prepare to move to the next ring
-            r_inner += h_rad
-
-        # After calling the `.update()` method some elements are still attached to the duplicate
-        # nodes that are no longer in the dictionary. Attach these plates to the nodes that are
-        # still in the dictionary instead. 
-        for element in self.elements.values():
-            element.i_node = self.nodes[element.i_node.Name]
-            element.j_node = self.nodes[element.j_node.Name]
-            element.m_node = self.nodes[element.m_node.Name]
-            element.n_node = self.nodes[element.n_node.Name]
+            # The last `num_outer` nodes created form the ring's outer radius
+            outer_nodes = list(ring.nodes.values())[-num_outer:]
 
 #%%
 class AnnulusRingMesh(Mesh):
@@ -746,7 +766,8 @@ class AnnulusRingMesh(Mesh):
     """
 
     def __init__(self, outer_radius, inner_radius, num_quads, t, E, nu, kx_mod=1, ky_mod=1,
-                 origin=[0, 0, 0], axis='Y', start_node='N1', start_element='Q1'):
+                 origin=[0, 0, 0], axis='Y', start_node='N1', start_element='Q1',
+                 inner_nodes=None):
 
         super().__init__(t, E, nu, kx_mod, ky_mod, start_node=start_node,
                          start_element=start_element)
@@ -760,6 +781,10 @@ class AnnulusRingMesh(Mesh):
 
         self.axis = axis
 
+        # Nodes already created by the caller for the inner radius of the ring. When given, the
+        # ring reuses them instead of generating duplicates.
+        self.inner_nodes = inner_nodes
+
         # Generate the nodes and elements
         self._generate()
 
@@ -776,7 +801,7 @@ class AnnulusRingMesh(Mesh):
 
         axis = self.axis
 
-        theta = 2*pi/self.n  # Angle between nodes in the ring
+        theta = tau/self.n  # Angle between nodes in the ring
 
         # Each node number will be increased by the offset calculated below
         node_offset = int(self.start_node[1:]) - 1
@@ -784,71 +809,35 @@ class AnnulusRingMesh(Mesh):
         # Each element number will be increased by the offset calculated below
         element_offset = int(self.start_element[1:]) - 1
 
-        # Generate the nodes that make up the ring, working from the inside to the outside
-        angle = 0
-        for i in range(1, 2*n + 1, 1):
-
-            # Assign the node a name
-            node_name = 'N' + str(i + node_offset)
-
-            # Generate the inner radius of nodes
-            if i <= n:
-                angle = theta*(i - 1)
-                if axis == 'Y':
-                    x = Xo + r1*cos(angle)
-                    y = Yo
-                    z = Zo + r1*sin(angle)
-                elif axis == 'X':
-                    x = Xo
-                    y = Yo + r1*sin(angle)
-                    z = Zo + r1*cos(angle)
-                elif axis == 'Z':
-                    x = Xo + r1*sin(angle)
-                    y = Yo + r1*cos(angle)
-                    z = Zo
-                else:
-                    raise Exception('Invalid axis specified for AnnulusRingMesh.')
-            
-            # Generate the outer radius of nodes
-            else:
-                angle = theta*((i - n) - 1)
-                if axis == 'Y':
-                    x = Xo + r2*cos(angle)
-                    y = Yo 
-                    z = Zo + r2*sin(angle)
-                elif axis == 'X':
-                    x = Xo
-                    y = Yo + r2*sin(angle)
-                    z = Zo + r2*cos(angle)
-                elif axis == 'Z':
-                    x = Xo + r2*sin(angle)
-                    y = Yo + r2*cos(angle)
-                    z = Zo
-                else:
-                    raise Exception('Invalid axis specified for AnnulusRingMesh.')
-            
-            self.nodes[node_name] = Node3D(node_name, x, y, z)
-
-        # Generate the elements that make up the ring
-        for i in range(1, n + 1, 1):
-
-            # Assign the element a name
-            element_name = 'Q' + str(i + element_offset)
-            
-            n_node = i
-            i_node = i + n
-            if i != n:
-                m_node = i + 1
-                j_node = i + 1 + n
-            else:
-                m_node = 1
-                j_node = 1 + n
-
-            self.elements[element_name] = Quad3D(element_name, self.nodes['N' + str(i_node + node_offset)],
-                                                               self.nodes['N' + str(j_node + node_offset)],
-                                                               self.nodes['N' + str(m_node + node_offset)],
-                                                               self.nodes['N' + str(n_node + node_offset)],
-                                                               self.t, self.E, self.nu, self.kx_mod, self.ky_mod)
+        if axis not in ('X', 'Y', 'Z'):
+            raise Exception('Invalid axis specified for AnnulusRingMesh.')
+
+        # Compute the node coordinates in one vectorized pass, working from the inside to the
+        # outside. If the caller supplied the inner radius of nodes, only the outer radius is
+        # generated.
+        xs, ys, zs = _ring_coords(n, theta, axis, Xo, Yo, Zo, r1, r2)
+        start = 1
+        if self.inner_nodes is not None:
+            xs, ys, zs = xs[n:], ys[n:], zs[n:]
+            start = n + 1
+
+        # Create the nodes that make up the ring, keeping a list in creation order so the element
+        # loop below can index nodes directly instead of rebuilding their names
+        node_names = [f'N{i + node_offset}' for i in range(start, start + len(xs))]
+        node_list = Node3D.from_arrays(node_names, xs, ys, zs)
+        self.nodes.update(zip(node_names, node_list))
+        if self.inner_nodes is not None:
+            node_list = list(self.inner_nodes) + node_list
+
+        # Generate the elements that make up the ring. The element properties are bound to locals
+        # and the elements are merged into the dictionary in one bulk update to keep attribute
+        # lookups out of the loop.
+        t, E, nu, kx_mod, ky_mod = self.t, self.E, self.nu, self.kx_mod, self.ky_mod
+        element_names = [f'Q{i + element_offset}' for i in range(1, n + 1)]
+        self.elements.update(
+            {name: Quad3D(name, node_list[i + n], node_list[(i + 1) % n + n],
+                          node_list[(i + 1) % n], node_list[i], t, E, nu, kx_mod, ky_mod)
+             for i, name in enumerate(element_names)})
 
 #%%
 class AnnulusTransRingMesh(Mesh):
@@ -858,7 +847,8 @@ class AnnulusTransRingMesh(Mesh):
     """
 
     def __init__(self, outer_radius, inner_radius, num_inner_quads, t, E, nu, kx_mod=1, ky_mod=1,
-                 origin=[0, 0, 0], axis='Y', start_node='N1', start_element='Q1'):
+                 origin=[0, 0, 0], axis='Y', start_node='N1', start_element='Q1',
+                 inner_nodes=None):
         """
         Parameters
         ----------
@@ -878,6 +868,10 @@ class AnnulusTransRingMesh(Mesh):
         self.Zo = origin[2]
         self.axis = axis
 
+        # Nodes already created by the caller for the inner radius of the ring. When given, the
+        # ring reuses them instead of generating duplicates.
+        self.inner_nodes = inner_nodes
+
         # Create the mesh
         self._generate()
 
@@ -895,9 +889,8 @@ class AnnulusTransRingMesh(Mesh):
 
         axis = self.axis
 
-        theta1 = 2*pi/self.n      # Angle between nodes at the inner radius of the ring
-        theta2 = 2*pi/(self.n*3)  # Angle between nodes at the center of the ring
-        theta3 = 2*pi/(self.n*3)  # Angle between nodes at the outer radius of the ring
+        theta1 = tau/self.n      # Angle between nodes at the inner radius of the ring
+        theta2 = tau/(self.n*3)  # Angle between nodes at the center and outer radii of the ring
 
         # Each node number will be increased by the offset calculated below
         node_offset = int(self.start_node[1:]) - 1
@@ -905,113 +898,51 @@ class AnnulusTransRingMesh(Mesh):
         # Each element number will be increased by the offset calculated below
         element_offset = int(self.start_element[1:]) - 1
 
-        # Generate the nodes that make up the ring, working from the inside to the outside
-        angle = 0
-        for i in range(1, 6*n + 1, 1):
-
-            # Assign the node a name
-            node_name = 'N' + str(i + node_offset)
-
-            # Generate the inner radius of nodes
-            if i <= n:
-                angle = theta1*(i - 1)
-                if axis == 'Y':
-                    x = Xo + r1*cos(angle)
-                    y = Yo
-                    z = Zo + r1*sin(angle)
-                elif axis == 'X':
-                    x = Xo
-                    y = Yo + r1*sin(angle)
-                    z = Zo + r1*cos(angle)
-                elif axis == 'Z':
-                    x = Xo + r1*sin(angle)
-                    y = Yo + r1*cos(angle)
-                    z = Zo
-                else:
-                    raise Exception('Invalid axis specified for AnnulusTransRingMesh.')
-            
-            # Generate the center radius of nodes
-            elif i <= 3*n:
-                if (i - n) == 1:
-                    angle = theta2
-                elif (i - n) % 2 == 0:
-                    angle += theta2
-                else:
-                    angle += 2*theta2
-                if axis == 'Y':
-                    x = Xo + r2*cos(angle)
-                    y = Yo 
-                    z = Zo + r2*sin(angle)
-                elif axis == 'X':
-                    x = Xo
-                    y = Yo + r2*sin(angle)
-                    z = Zo + r2*cos(angle)
-                elif axis == 'Z':
-                    x = Xo + r2*sin(angle)
-                    y = Yo + r2*cos(angle)
-                    z = Zo
-            # Generate the outer radius of nodes
-            else:
-                if (i - 3*n) == 1:
-                    angle = 0
-                else:
-                    angle = theta3*((i - 3*n) - 1)
-                if axis == 'Y':
-                    x = Xo + r3*cos(angle)
-                    y = Yo 
-                    z = Zo + r3*sin(angle)
-                elif axis == 'X':
-                    x = Xo
-                    y = Yo + r3*sin(angle)
-                    z = Zo + r3*cos(angle)
-                elif axis == 'Z':
-                    x = Xo + r3*sin(angle)
-                    y = Yo + r3*cos(angle)
-                    z = Zo
-                else:
-                    raise Exception('Invalid axis specified for AnnulusTransRingMesh.')
-            
-            self.nodes[node_name] = Node3D(node_name, x, y, z)
-
-        # Generate the elements that make up the ring
-        for i in range(1, 4*n + 1, 1):
-
-            # Assign the element a name
-            element_name = 'Q' + str(i + element_offset)
-
-            if i <= n:
-                n_node = i
-                j_node = 2*i + n
-                i_node = 2*i + n - 1
-                if i != n:
-                    m_node = i + 1
-                else:
-                    m_node = 1
-            elif (i - n) % 3 == 1:
-                n_node = 1 + (i - (n + 1))//3
-                m_node = i - (i - (n + 1))//3
-                j_node = i + 2*n + 1
-                i_node = i + 2*n
-            elif (i - n) % 3 == 2:
-                n_node = i - 1 - (i - (n + 1))//3
-                m_node = i - (i - (n + 1))//3
-                j_node = i + 2*n + 1
-                i_node = i + 2*n            
-            else:
-                n_node = i - 1 - (i - (n + 1))//3
-                i_node = i + 2*n
-                if i != 4*n:
-                    m_node = 2 + (i - (n + 1))//3
-                    j_node = i + 2*n + 1
-                else:
-                    m_node = 1
-                    j_node = 1 + 3*n
-
-            self.elements[element_name] = Quad3D(element_name, self.nodes['N' + str(i_node + node_offset)],
-                                                               self.nodes['N' + str(j_node + node_offset)],
-                                                               self.nodes['N' + str(m_node + node_offset)],
-                                                               self.nodes['N' + str(n_node + node_offset)],
-                                                               self.t, self.E, self.nu, self.kx_mod, self.ky_mod)
+        if axis not in ('X', 'Y', 'Z'):
+            raise Exception('Invalid axis specified for AnnulusTransRingMesh.')
+
+        # Build the angle of every node position up front, working from the inside to the
+        # outside. The angle steps at the center radius alternate between `theta2` and `2*theta2`
+        # so the center nodes pair up under the outer nodes; a cumulative sum of those steps
+        # reproduces the sequence.
+        center_steps = full(2*n, theta2)
+        center_steps[2::2] = 2*theta2
+        angles = concatenate((arange(n)*theta1, cumsum(center_steps), arange(3*n)*theta2))
+
+        # Compute the node coordinates in one vectorized pass with a single set of trig calls,
+        # assembling the global coordinates through the axis component table
+        radii = concatenate((full(n, r1), full(2*n, r2), full(3*n, r3)))
+        components = {'cos': radii*cos(angles),
+                      'sin': radii*sin(angles),
+                      'axial': full(6*n, 0.0)}
+        cx, cy, cz = _AXIS_COMPONENTS[axis]
+        xs, ys, zs = Xo + components[cx], Yo + components[cy], Zo + components[cz]
+
+        # If the caller supplied the inner radius of nodes, only the center and outer radii are
+        # generated
+        start = 1
+        if self.inner_nodes is not None:
+            xs, ys, zs = xs[n:], ys[n:], zs[n:]
+            start = n + 1
+
+        # Create the nodes that make up the ring, keeping a list in creation order so the element
+        # loop below can index nodes directly instead of rebuilding their names
+        node_names = [f'N{i + node_offset}' for i in range(start, start + len(xs))]
+        node_list = Node3D.from_arrays(node_names, xs, ys, zs)
+        self.nodes.update(zip(node_names, node_list))
+        if self.inner_nodes is not None:
+            node_list = list(self.inner_nodes) + node_list
+
+        # Generate the elements that make up the ring from the precomputed connectivity table.
+        # The element properties are bound to locals and the elements are merged into the
+        # dictionary in one bulk update to keep attribute lookups out of the loop.
+        t, E, nu, kx_mod, ky_mod = self.t, self.E, self.nu, self.kx_mod, self.ky_mod
+        self.elements.update(
+            {f'Q{i + element_offset}': Quad3D(f'Q{i + element_offset}',
+                                              node_list[i_node - 1], node_list[j_node - 1],
+                                              node_list[m_node - 1], node_list[n_node - 1],
+                                              t, E, nu, kx_mod, ky_mod)
+             for i, (i_node, j_node, m_node, n_node) in enumerate(_trans_ring_connectivity(n), 1)})
 
 #%%
 class FrustrumMesh(AnnulusMesh):
@@ -1030,20 +961,25 @@ class FrustrumMesh(AnnulusMesh):
         Yo = origin[1]
         Zo = origin[2]
 
-        # Adjust the cooridnates of each node to make a frustrum
-        for node in self.nodes.values():
-            X = node.X
-            Y = node.Y
-            Z = node.Z
-            r = ((X - Xo)**2 + (Z - Zo)**2)**0.5
-            if axis == 'Y':
-                node.Y += (r - large_radius)/(large_radius - small_radius)*height
-            elif axis == 'X':
-                node.X += (r - large_radius)/(large_radius - small_radius)*height
-            elif axis == 'Z':
-                node.Z += (r - large_radius)/(large_radius - small_radius)*height
-            else:
-                raise Exception('Invalid axis specified for frustrum mesh.')
+        if axis not in ('Y', 'X', 'Z'):
+            raise Exception('Invalid axis specified for frustrum mesh.')
+
+        # Adjust the cooridnates of each node to make a frustrum. The radial offsets for all the
+        # nodes are computed in one vectorized pass.
+        nodes = list(self.nodes.values())
+        X = array([node.X for node in nodes])
+        Z = array([node.Z for node in nodes])
+        r = ((X - Xo)**2 + (Z - Zo)**2)**0.5
+        offsets = (r - large_radius)/(large_radius - small_radius)*height
+        if axis == 'Y':
+            for node, offset in zip(nodes, offsets):
+                node.Y += offset
+        elif axis == 'X':
+            for node, offset in zip(nodes, offsets):
+                node.X += offset
+        else:
+            for node, offset in zip(nodes, offsets):
+                node.Z += offset
 
 #%%
 class CylinderMesh(Mesh):
@@ -1101,7 +1037,7 @@ class CylinderMesh(Mesh):
         self.mesh_size = mesh_size
 
         if num_elements == None:
-            self.num_elements = int(round(2*pi*radius/mesh_size, 0))
+            self.num_elements = int(tau*radius/mesh_size + 0.5)
         else:
             self.num_elements = num_elements
         
@@ -1132,10 +1068,12 @@ class CylinderMesh(Mesh):
 
         # Determine the number of quads to mesh the circumference into
         if num_elements == None:
-            num_elements = int(2*pi/mesh_size)
+            num_elements = int(tau/mesh_size)
 
-        # Mesh the cylinder from the bottom toward the top
-        while round(y, 10) < round(h, 10):
+        # Mesh the cylinder from the bottom toward the top. Each ring reuses the previous ring's
+        # top nodes as its bottom nodes, so shared boundary nodes are only ever created once.
+        top_nodes = None
+        while y < h - _TOL:
             
             height = h - y                  # Remaining height to be meshed
             n_vert = int(height/mesh_size)  # Number of times the plate height fits in the remaining unmeshed height
@@ -1144,35 +1082,29 @@ class CylinderMesh(Mesh):
             # Create a mesh of nodes for the ring
             if self.axis == 'Y':
                 ring = CylinderRingMesh(radius, h_y, num_elements, t, E, nu, 1, 1, [0, y, 0],
-                                        self.axis, 'N' + str(n), 'Q' + str(q), element_type)
+                                        self.axis, f'N{n}', f'Q{q}', element_type,
+                                        bottom_nodes=top_nodes)
             elif self.axis == 'X':
                 ring = CylinderRingMesh(radius, h_y, num_elements, t, E, nu, 1, 1, [y, 0, 0],
-                                        self.axis, 'N' + str(n), 'Q' + str(q), element_type)
+                                        self.axis, f'N{n}', f'Q{q}', element_type,
+                                        bottom_nodes=top_nodes)
             elif self.axis == 'Z':
                 ring = CylinderRingMesh(radius, h_y, num_elements, t, E, nu, 1, 1, [0, 0, y],
-                                        self.axis, 'N' + str(n), 'Q' + str(q), element_type)
+                                        self.axis, f'N{n}', f'Q{q}', element_type,
+                                        bottom_nodes=top_nodes)
 
             n += num_elements
             q += num_elements
         
-            # Add the newly generated nodes and elements to the overall mesh. Note that if duplicate
-            # keys exist, the `.update()` method will overwrite them with the newly generated key value
-            # pairs. This works in our favor by automatically eliminating duplicate nodes at the shared
-            # boundaries between rings.
+            # Add the newly generated nodes and elements to the overall mesh
             self.nodes.update(ring.nodes)
             self.elements.update(ring.elements)
 
+            # The last `num_elements` nodes created form the ring's top ring of nodes
+            top_nodes = list(ring.nodes.values())[-num_elements:]
+
             # Prepare to move to the next ring
             y += h_y
-        
-        # After calling the `.update()` method some elements are still attached to the duplicate
-        # nodes that are no longer in the dictionary. Attach these plates to the nodes that are
-        # still in the dictionary instead. 
-        for element in self.elements.values():
-            element.i_node = self.nodes[element.i_node.Name]
-            element.j_node = self.nodes[element.j_node.Name]
-            element.m_node = self.nodes[element.m_node.Name]
-            element.n_node = self.nodes[element.n_node.Name]
 
 
 #%%
@@ -1219,7 +1151,7 @@ class CylinderRingMesh(Mesh):
 
     def __init__(self, radius, height, num_elements, t, E, nu, kx_mod=1, ky_mod=1,
                  origin=[0, 0, 0], axis='Y', start_node='N1', start_element='Q1',
-                 element_type='Quad'):
+                 element_type='Quad', bottom_nodes=None):
 
         super().__init__(t, E, nu, kx_mod, ky_mod, start_node=start_node, start_element=start_element)
 
@@ -1232,6 +1164,10 @@ class CylinderRingMesh(Mesh):
         self.axis = axis
         self.element_type = element_type
 
+        # Nodes already created by the caller for the bottom of the ring. When given, the ring
+        # reuses them instead of generating duplicates.
+        self.bottom_nodes = bottom_nodes
+
         # Generate the nodes and elements
         self._generate()
 
@@ -1253,7 +1189,7 @@ class CylinderRingMesh(Mesh):
         axis = self.axis
         
         # Calculate the angle between nodes in the circumference of the ring
-        theta = 2*pi/num_elements
+        theta = tau/num_elements
 
         # Each node number will be increased by the offset calculated below
         try:
@@ -1267,82 +1203,41 @@ class CylinderRingMesh(Mesh):
         except:
             raise ValueError('Invalid element ame. Enter a letter followed by a number (e.g. \'Q83\')')
 
-        # Generate the nodes that make up the ring
-        angle = 0
-        for i in range(1, 2*n + 1, 1):
-
-            # Assign the node a name
-            node_name = 'N' + str(i + node_offset)
-
-            # Generate the bottom nodes of the ring
-            if i <= n:
-                angle = theta*(i - 1)
-                if axis == 'Y':
-                    x = Xo + radius*cos(angle)
-                    y = Yo
-                    z = Zo + radius*sin(angle)
-                elif axis == 'X':
-                    x = Xo
-                    y = Yo + radius*sin(angle)
-                    z = Zo + radius*cos(angle)
-                elif axis == 'Z':
-                    x = Xo + radius*sin(angle)
-                    y = Yo + radius*cos(angle)
-                    z = Zo
-                else:
-                    raise Exception('Invalid axis specified for CylinderRingMesh.')
-
-            # Generate the top nodes of the ring
-            else:
-                angle = theta*((i - n) - 1)
-                if axis == 'Y':
-                    x = Xo + radius*cos(angle)
-                    y = Yo + height
-                    z = Zo + radius*sin(angle)
-                elif axis == 'X':
-                    x = Xo + height
-                    y = Yo + radius*sin(angle)
-                    z = Zo + radius*cos(angle)
-                elif axis == 'Z':
-                    x = Xo + radius*sin(angle)
-                    y = Yo + radius*cos(angle)
-                    z = Zo + height
-                else:
-                    raise Exception('Invalid axis specified for CylinderRingMesh.')
-            
-            self.nodes[node_name] = Node3D(node_name, x, y, z)
-
-        # Generate the elements that make up the ring
-        for i in range(1, n + 1, 1):
-
-            # Assign the element a name
-            if self.element_type == 'Quad':
-                element_name = 'Q' + str(i + element_offset)
-            elif self.element_type == 'Rect':
-                element_name = 'R' + str(i + element_offset)
-            else:
-                raise Exception('Invalid element type specified for cylinder ring mesh.')
-            
-            # Assign nodes to the element
-            n_node = i
-            i_node = i + n
-            if i != n:
-                m_node = i + 1
-                j_node = i + 1 + n
-            else:
-                m_node = 1
-                j_node = 1 + n
-
-            # Create the element and add it to the `elements` dictionary
-            if self.element_type == 'Quad':
-                self.elements[element_name] = Quad3D(element_name, self.nodes['N' + str(i_node + node_offset)],
-                                                     self.nodes['N' + str(j_node + node_offset)],
-                                                     self.nodes['N' + str(m_node + node_offset)],
-                                                     self.nodes['N' + str(n_node + node_offset)],
-                                                     self.t, self.E, self.nu, self.kx_mod, self.ky_mod)
-            elif self.element_type == 'Rect':
-                self.elements[element_name] = Plate3D(element_name, self.nodes['N' + str(i_node + node_offset)],
-                                                      self.nodes['N' + str(j_node + node_offset)],
-                                                      self.nodes['N' + str(m_node + node_offset)],
-                                                      self.nodes['N' + str(n_node + node_offset)],
-                                                      self.t, self.E, self.nu, self.kx_mod, self.ky_mod)
+        if axis not in ('X', 'Y', 'Z'):
+            raise Exception('Invalid axis specified for CylinderRingMesh.')
+
+        # Compute the node coordinates in one vectorized pass, bottom ring first, then top ring.
+        # If the caller supplied the bottom ring of nodes, only the top ring is generated.
+        xs, ys, zs = _ring_coords(n, theta, axis, Xo, Yo, Zo, radius, radius, 0.0, height)
+        start = 1
+        if self.bottom_nodes is not None:
+            xs, ys, zs = xs[n:], ys[n:], zs[n:]
+            start = n + 1
+
+        # Create the nodes that make up the ring, keeping a list in creation order so the element
+        # loop below can index nodes directly instead of rebuilding their names
+        node_names = [f'N{i + node_offset}' for i in range(start, start + len(xs))]
+        node_list = Node3D.from_arrays(node_names, xs, ys, zs)
+        self.nodes.update(zip(node_names, node_list))
+        if self.bottom_nodes is not None:
+            node_list = list(self.bottom_nodes) + node_list
+
+        # Determine the element type and name prefix once for the whole ring
+        if self.element_type == 'Quad':
+            element_class = Quad3D
+            prefix = 'Q'
+        elif self.element_type == 'Rect':
+            element_class = Plate3D
+            prefix = 'R'
+        else:
+            raise Exception('Invalid element type specified for cylinder ring mesh.')
+
+        # Generate the elements that make up the ring. The element properties are bound to locals
+        # and the elements are merged into the dictionary in one bulk update to keep attribute
+        # lookups out of the loop.
+        t, E, nu, kx_mod, ky_mod = self.t, self.E, self.nu, self.kx_mod, self.ky_mod
+        element_names = [f'{prefix}{i + element_offset}' for i in range(1, n + 1)]
+        self.elements.update(
+            {name: element_class(name, node_list[i + n], node_list[(i + 1) % n + n],
+                                 node_list[(i + 1) % n], node_list[i], t, E, nu, kx_mod, ky_mod)
+             for i, name in enumerate(element_names)})
@@ -9,7 +9,27 @@ class Node3D():
     """
     A class representing a node in a 3D finite element model.
     """
-    
+
+    # Meshes create nodes by the thousands, so fixed slots are used instead of a per-instance
+    # attribute dictionary to cut construction time and memory
+    __slots__ = ('Name', 'ID', 'X', 'Y', 'Z', 'NodeLoads',
+                 'DX', 'DY', 'DZ', 'RX', 'RY', 'RZ',
+                 'RxnFX', 'RxnFY', 'RxnFZ', 'RxnMX', 'RxnMY', 'RxnMZ',
+                 'support_DX', 'support_DY', 'support_DZ',
+                 'support_RX', 'support_RY', 'support_RZ',
+                 'spring_DX', 'spring_DY', 'spring_DZ',
+                 'spring_RX', 'spring_RY', 'spring_RZ',
+                 'EnforcedDX', 'EnforcedDY', 'EnforcedDZ',
+                 'EnforcedRX', 'EnforcedRY', 'EnforcedRZ', 'contour')
+
+    @classmethod
+    def from_arrays(cls, names, X, Y, Z):
+        """
+        Creates a list of nodes from parallel sequences of names and coordinates. Meshes use this
+        to turn their vectorized coordinate arrays into nodes in one batch.
+        """
+        return [cls(name, x, y, z) for name, x, y, z in zip(names, X, Y, Z)]
+
     def __init__(self, Name, X, Y, Z):
         
         self.Name = Name    # A unique name for the node assigned by the user
@@ -569,6 +569,34 @@ class Plate3D():
         # Return the plate bending constants
         return inv(self._C())*d
 
+    def moment_samples(self, points, combo_name='Combo 1'):
+        """
+        Returns the internal moments (Mx, My, and Mxy) at multiple points in the plate's local
+        coordinate system, computing the plate bending constants once for all the points.
+
+        Parameters
+        ----------
+        points : sequence
+            An iterable of local (x, y) coordinate pairs.
+        combo_name : string
+            The name of the load combination to evaluate. The default is 'Combo 1'.
+
+        """
+
+        # Store matrices into local variables for quicker access
+        Db = self.Db()
+        a = self._a(combo_name)
+
+        # Calculate the internal moments at each requested location
+        # A negative sign will be applied to change the sign convention to match that of
+        # PyNite's quadrilateral elements.
+        results = []
+        for x, y in points:
+            m = -Db @ self._Q(x, y) @ a
+            results.append([m[0, 0], m[1, 0], m[2, 0]])
+
+        return array(results)
+
     def moment(self, x, y, combo_name='Combo 1'):
         """
         Returns the internal moments (Mx, My, and Mxy) at any point (x, y) in the plate's local
@@ -590,6 +618,50 @@ class Plate3D():
         # PyNite's quadrilateral elements.
         return -self.Db() @ self._Q(x, y) @ self._a(combo_name)
  
+    def shear_samples(self, points, combo_name='Combo 1'):
+        """
+        Returns the internal shears (Qx and Qy) at multiple points in the plate's local
+        coordinate system, computing the plate bending constants once for all the points.
+
+        Parameters
+        ----------
+        points : sequence
+            An iterable of local (x, y) coordinate pairs.
+        combo_name : string
+            The name of the load combination to evaluate. The default is 'Combo 1'.
+
+        """
+
+        # Store matrices into local variables for quicker access
+        Db = self.Db()
+        a = self._a(combo_name)
+
+        results = []
+        for x, y in points:
+
+            # Calculate the derivatives of the plate moments needed to compute shears
+            dMx_dx = (Db*matrix([[0, 0, 0, 0, 0, 0, -6, 0, 0, 0, -6*y, 0],
+                                 [0, 0, 0, 0, 0, 0, 0, 0, -2, 0, 0, -6*y],
+                                 [0, 0, 0, 0, 0, 0, 0, -4, 0, 0, -12*x, 0]])*a)[0]
+
+            dMxy_dy = (Db*matrix([[0, 0, 0, 0, 0, 0, 0, -2, 0, 0, -6*x, 0],
+                                  [0, 0, 0, 0, 0, 0, 0, 0, 0, -6, 0, -6*x],
+                                  [0, 0, 0, 0, 0, 0, 0, 0, -4, 0, 0, -12*y]])*a)[2]
+            
+            dMy_dy = (Db*matrix([[0, 0, 0, 0, 0, 0, 0, -2, 0, 0, -6*x, 0],
+                                 [0, 0, 0, 0, 0, 0, 0, 0, 0, -6, 0, -6*x],
+                                 [0, 0, 0, 0, 0, 0, 0, 0, -4, 0, 0, -12*y]])*a)[1]
+
+            dMxy_dx = (Db*matrix([[0, 0, 0, 0, 0, 0, -6, 0, 0, 0, -6*y, 0],
+                                  [0, 0, 0, 0, 0, 0, 0, 0, -2, 0, 0, -6*y],
+                                  [0, 0, 0, 0, 0, 0, 0, -4, 0, 0, -12*x, 0]])*a)[2]
+            
+            # Calculate internal shears
+            results.append([(dMx_dx + dMxy_dy)[0, 0],
+                            (dMy_dy + dMxy_dx)[0, 0]])
+
+        return array(results)
+
     def shear(self, x, y, combo_name='Combo 1'):
         """
         Returns the internal shears (Qx and Qy) at any point (x, y) in the plate's local
@@ -606,30 +678,8 @@ class Plate3D():
 
         """
 
-        # Store matrices into local variables for quicker access
-        Db = self.Db()
-        a = self._a(combo_name)
-
-        # Calculate the derivatives of the plate moments needed to compute shears
-        dMx_dx = (Db*matrix([[0, 0, 0, 0, 0, 0, -6, 0, 0, 0, -6*y, 0],
-                             [0, 0, 0, 0, 0, 0, 0, 0, -2, 0, 0, -6*y],
-                             [0, 0, 0, 0, 0, 0, 0, -4, 0, 0, -12*x, 0]])*a)[0]
-
-        dMxy_dy = (Db*matrix([[0, 0, 0, 0, 0, 0, 0, -2, 0, 0, -6*x, 0],
-                              [0, 0, 0, 0, 0, 0, 0, 0, 0, -6, 0, -6*x],
-                              [0, 0, 0, 0, 0, 0, 0, 0, -4, 0, 0, -12*y]])*a)[2]
-        
-        dMy_dy = (Db*matrix([[0, 0, 0, 0, 0, 0, 0, -2, 0, 0, -6*x, 0],
-                             [0, 0, 0, 0, 0, 0, 0, 0, 0, -6, 0, -6*x],
-                             [0, 0, 0, 0, 0, 0, 0, 0, -4, 0, 0, -12*y]])*a)[1]
-
-        dMxy_dx = (Db*matrix([[0, 0, 0, 0, 0, 0, -6, 0, 0, 0, -6*y, 0],
-                              [0, 0, 0, 0, 0, 0, 0, 0, -2, 0, 0, -6*y],
-                              [0, 0, 0, 0, 0, 0, 0, -4, 0, 0, -12*x, 0]])*a)[2]
-        
-        # Calculate internal shears
-        Qx = (dMx_dx + dMxy_dy)[0, 0]
-        Qy = (dMy_dy + dMxy_dx)[0, 0]
+        # Sample the shear at the requested location
+        Qx, Qy = self.shear_samples(((x, y),), combo_name)[0]
 
         # Return internal shears
         return matrix([[Qx], 
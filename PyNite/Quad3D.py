@@ -708,23 +708,22 @@ class Quad3D():
         return T
 
 #%%
-    def shear(self, r=0, s=0, combo_name='Combo 1'):
+    def shear_samples(self, points, combo_name='Combo 1'):
         '''
-        Returns the interal shears at any point in the quad element.
+        Returns the internal shears at multiple points in the quad element.
 
-        Internal shears are reported as a 2D array [[Qx], [Qy]] at the
-        specified location in the (r, s) natural coordinate system.
+        Internal shears are reported as a 2D array with one [Qx, Qy] row per requested point in
+        the (r, s) natural coordinate system. The gauss point shears only depend on the load
+        combination, so they are computed once and extrapolated to each of the requested points.
 
         Parameters
         ----------
-        r : number
-            The r-coordinate. Default is 0.
-        s : number
-            The s-coordinate. Default is 0.
+        points : sequence
+            An iterable of (r, s) natural coordinate pairs.
         
         Returns
         -------
-        Internal shear force per unit length of the quad element.
+        Internal shear forces per unit length of the quad element.
         '''
 
         # Get the plate's local displacement vector
@@ -734,13 +733,6 @@ class Quad3D():
         # Define the gauss point used for numerical integration
         gp = 1/3**0.5
 
-        # Define extrapolated r and s points
-        r_ex = r/gp
-        s_ex = s/gp
-
-        # Define the interpolation functions
-        H = 1/4*array([(1 + r_ex)*(1 + s_ex), (1 - r_ex)*(1 + s_ex), (1 - r_ex)*(1 - s_ex), (1 + r_ex)*(1 - s_ex)])
-
         # Get the stress-strain matrix
         Cs = self.Cs()
 
@@ -750,19 +742,27 @@ class Quad3D():
         q3 = matmul(Cs, matmul(self.B_gamma_MITC4(-gp, -gp), d))
         q4 = matmul(Cs, matmul(self.B_gamma_MITC4(gp, -gp), d))
 
-        # Extrapolate to get the value at the requested location
-        Qx = H[0]*q1[0] + H[1]*q2[0] + H[2]*q3[0] + H[3]*q4[0]
-        Qy = H[0]*q1[1] + H[1]*q2[1] + H[2]*q3[1] + H[3]*q4[1]
+        # Extrapolate to get the value at each requested location
+        results = []
+        for r, s in points:
 
-        return array([Qx,
-                      Qy])
+            # Define extrapolated r and s points
+            r_ex = r/gp
+            s_ex = s/gp
 
-#%%   
-    def moment(self, r=0, s=0, combo_name='Combo 1'):
+            # Define the interpolation functions
+            H = 1/4*array([(1 + r_ex)*(1 + s_ex), (1 - r_ex)*(1 + s_ex), (1 - r_ex)*(1 - s_ex), (1 + r_ex)*(1 - s_ex)])
+
+            results.append([(H[0]*q1[0] + H[1]*q2[0] + H[2]*q3[0] + H[3]*q4[0])[0],
+                            (H[0]*q1[1] + H[1]*q2[1] + H[2]*q3[1] + H[3]*q4[1])[0]])
+
+        return array(results)
+
+    def shear(self, r=0, s=0, combo_name='Combo 1'):
         '''
-        Returns the interal moments at any point in the quad element.
+        Returns the interal shears at any point in the quad element.
 
-        Internal moments are reported as a 2D array [[Mx], [My], [Mxy]] at the
+        Internal shears are reported as a 2D array [[Qx], [Qy]] at the
         specified location in the (r, s) natural coordinate system.
 
         Parameters
@@ -774,7 +774,33 @@ class Quad3D():
         
         Returns
         -------
-        Internal moment per unit length of the quad element.
+        Internal shear force per unit length of the quad element.
+        '''
+
+        # Sample the shear at the requested location
+        Qx, Qy = self.shear_samples(((r, s),), combo_name)[0]
+
+        return array([[Qx],
+                      [Qy]])
+
+#%%   
+    def moment_samples(self, points, combo_name='Combo 1'):
+        '''
+        Returns the internal moments at multiple points in the quad element.
+
+        Internal moments are reported as a 2D array with one [Mx, My, Mxy] row per requested
+        point in the (r, s) natural coordinate system. The gauss point moments only depend on the
+        load combination, so they are computed once and extrapolated to each of the requested
+        points.
+
+        Parameters
+        ----------
+        points : sequence
+            An iterable of (r, s) natural coordinate pairs.
+        
+        Returns
+        -------
+        Internal moments per unit length of the quad element.
         '''
 
         # Get the plate's local displacement vector
@@ -784,13 +810,6 @@ class Quad3D():
         # Define the gauss point used for numerical integration
         gp = 1/3**0.5
 
-        # # Define extrapolated r and s points
-        r_ex = r/gp
-        s_ex = s/gp
-
-        # Define the interpolation functions
-        H = 1/4*array([(1 + r_ex)*(1 + s_ex), (1 - r_ex)*(1 + s_ex), (1 - r_ex)*(1 - s_ex), (1 + r_ex)*(1 - s_ex)])
-
         # Get the stress-strain matrix
         Cb = self.Cb()
 
@@ -800,14 +819,48 @@ class Quad3D():
         m3 = matmul(Cb, matmul(self.B_kappa(-gp, -gp), d))
         m4 = matmul(Cb, matmul(self.B_kappa(gp, -gp), d))
 
-        # Extrapolate to get the value at the requested location
-        Mx = H[0]*m1[0] + H[1]*m2[0] + H[2]*m3[0] + H[3]*m4[0]
-        My = H[0]*m1[1] + H[1]*m2[1] + H[2]*m3[1] + H[3]*m4[1]
-        Mxy = H[0]*m1[2] + H[1]*m2[2] + H[2]*m3[2] + H[3]*m4[2]
+        # Extrapolate to get the value at each requested location
+        results = []
+        for r, s in points:
+
+            # Define extrapolated r and s points
+            r_ex = r/gp
+            s_ex = s/gp
+
+            # Define the interpolation functions
+            H = 1/4*array([(1 + r_ex)*(1 + s_ex), (1 - r_ex)*(1 + s_ex), (1 - r_ex)*(1 - s_ex), (1 + r_ex)*(1 - s_ex)])
+
+            results.append([(H[0]*m1[0] + H[1]*m2[0] + H[2]*m3[0] + H[3]*m4[0])[0],
+                            (H[0]*m1[1] + H[1]*m2[1] + H[2]*m3[1] + H[3]*m4[1])[0],
+                            (H[0]*m1[2] + H[1]*m2[2] + H[2]*m3[2] + H[3]*m4[2])[0]])
+
+        return array(results)
+
+    def moment(self, r=0, s=0, combo_name='Combo 1'):
+        '''
+        Returns the interal moments at any point in the quad element.
+
+        Internal moments are reported as a 2D array [[Mx], [My], [Mxy]] at the
+        specified location in the (r, s) natural coordinate system.
+
+        Parameters
+        ----------
+        r : number
+            The r-coordinate. Default is 0.
+        s : number
+            The s-coordinate. Default is 0.
+        
+        Returns
+        -------
+        Internal moment per unit length of the quad element.
+        '''
+
+        # Sample the moment at the requested location
+        Mx, My, Mxy = self.moment_samples(((r, s),), combo_name)[0]
         
-        return array([Mx,
-                      My,
-                      Mxy])
+        return array([[Mx],
+                      [My],
+                      [Mxy]])
 
 #%%
     def membrane(self, r=0, s=0, combo_name='Combo 1'):
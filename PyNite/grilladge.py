@@ -1,11 +1,31 @@
 import numpy as np
-import math
+import functools
 
 from FEModel3D import FEModel3D
+from Node3D import Node3D
 import Visualization as vis
 
+@functools.lru_cache(maxsize=8)
+def _z_coors_g1_cached(spans, discr, dtype=np.float64):
+    """computes z coordinates in first girder for given span lengths and discretization"""
+    spans = np.asarray(spans)
+    span_starts = np.concatenate(([0.0], np.cumsum(spans[:-1])))
+    #  one broadcast builds the node positions of every span at once
+    z_grid = span_starts[:, None] + (spans / discr)[:, None] * np.arange(1, discr + 1)
+    return np.concatenate(([0.0], z_grid.ravel())).astype(dtype, copy=False)
+
+
+@functools.lru_cache(maxsize=8)
+def _z_coors_g1_rounded(spans, discr, dtype=np.float64):
+    """rounded, read-only variant of _z_coors_g1_cached, shared between callers"""
+    z_rounded = np.round(_z_coors_g1_cached(spans, discr, dtype), decimals=3)
+    z_rounded.setflags(write=False)
+    return z_rounded
+
+
 class Grilladge(FEModel3D):
-    def __init__(self, no_of_beams=2, beam_spacing=8, span_data=(2, 28, 28), canti_l=2.5, skew=90): 
+    def __init__(self, no_of_beams=2, beam_spacing=8, span_data=(2, 28, 28), canti_l=2.5, skew=90,
+                 coor_dtype=np.float64): 
         #  https://www.youtube.com/watch?v=MBbVq_FIYDA
         super().__init__()
         self.no_of_beams = no_of_beams
@@ -13,104 +33,104 @@ class Grilladge(FEModel3D):
         self.span_data = span_data
         self.skew = skew
         self.canti_l = canti_l
- 
+        #  dtype of the generated coordinate arrays; np.float32 halves the memory of very fine
+        #  meshes and still exceeds millimetre precision on bridge-scale spans
+        self.coor_dtype = coor_dtype
+        #  an unskewed (rectangular) deck lets the z helpers skip the offset arithmetic
+        self._is_rectangular = (skew == 90)
+        #  span layout as arrays, precomputed once for the coordinate kernels
+        self._spans = np.asarray(span_data[1:span_data[0]+1], dtype=np.float64)
+        self._span_offsets = np.concatenate(([0.0], np.cumsum(self._spans)))
+
+    @staticmethod
+    def _validate_int(value, name):
+        """raises TypeError unless value is an integer"""
+        if isinstance(value, int) == False:
+            raise TypeError(f"{name} must be an integer!")
+
+    @staticmethod
+    def _validate_number(value, name):
+        """raises TypeError unless value is a float or integer"""
+        if isinstance(value, float) == False and isinstance(value, int) == False:
+            raise TypeError(f"{name} must be a float or integer!")
+
+    @functools.cached_property
+    def _cot_skew(self):
+        """cotangent of the skew angle, computed once per instance (exactly 0 for no skew)"""
+        if self.skew == 90:
+            return 0.0
+        return 1 / np.tan(np.radians(self.skew))
+
     def _z_coors_in_g1(self, discr=20):
         """returns numpy array of z coordinates in first girder"""
-        if isinstance(discr, int) == False:
-            raise TypeError(f"discr must be an integer!")
-        z_coors_in_g1 = np.array([0.0])
-        for j in range(self.span_data[0]):
-            z1_spacing = self.span_data[j+1] / discr
-            if j == 0:
-                z_local = 0
-            else:
-                z_local = sum(self.span_data[1:j+1])
-            for i in range(discr):
-                z_local += z1_spacing
-                z_coors_in_g1 = np.append(z_coors_in_g1, [z_local])
-        return np.round(z_coors_in_g1, decimals=3)
+        self._validate_int(discr, 'discr')
+        return self._z_rounded(discr)
+
+    def _z_base(self, discr):
+        """cached unrounded z coordinates of the first girder - shared array, callers must not
+        mutate it"""
+        return _z_coors_g1_cached(tuple(self._spans), discr, self.coor_dtype)
+
+    def _z_rounded(self, discr):
+        """cached rounded z coordinates of the first girder - the array is read-only so it can
+        be handed out without copying"""
+        return _z_coors_g1_rounded(tuple(self._spans), discr, self.coor_dtype)
     
     def _z_coors_in_g(self, discr=20, gird_no=2):
         """returns numpy array of z coordinates in given girder"""
-        if isinstance(discr, int) == False:
-            raise TypeError(f"discr must be an integer!")
-        if isinstance(gird_no, int) == False:
-            raise TypeError(f"gird_no must be an integer!")
-        if gird_no == 1 or self.skew == 90:
-            z_coors_in_g = self._z_coors_in_g1(discr)
-        else:
-            rad_skew = math.radians(self.skew)  # skew angle in radians
-            z_offset = (gird_no - 1) * self.beam_spacing * (1 / math.tan(rad_skew))
-            z_coors_in_g = self._z_coors_in_g1(discr) + z_offset
-        return np.round(z_coors_in_g, decimals=3)
+        self._validate_int(discr, 'discr')
+        self._validate_int(gird_no, 'gird_no')
+        if gird_no == 1 or self._is_rectangular:
+            return self._z_rounded(discr)
+        z_offset = (gird_no - 1) * self.beam_spacing * self._cot_skew
+        z_coors_in_g = self._z_base(discr) + z_offset
+        return np.round(z_coors_in_g, decimals=3, out=z_coors_in_g)
 
     def _z_coors_of_cantitip(self, discr=20, edge=1):
         """returns numpy array of z cooridnates of cantilever tips"""
-        if isinstance(discr, int) == False:
-            raise TypeError(f"discr must be an integer!")
-        if isinstance(edge, int) == False:
-            raise TypeError(f"edge must be an integer!")
-        if self.skew == 90:
-            z_coors_of_cantitip = self._z_coors_in_g1(discr)
-        elif edge == 1:
-            rad_skew = math.radians(self.skew)  # skew angle in radians
-            z_offset = self.canti_l * (1 / math.tan(rad_skew))
-            z_coors_of_cantitip = self._z_coors_in_g1(discr) - z_offset
-        else:
-            rad_skew = math.radians(self.skew) 
-            z_offset = (self.canti_l + (self.no_of_beams -1) * self.beam_spacing) \
-                * (1 / math.tan(rad_skew))
-            z_coors_of_cantitip = self._z_coors_in_g1(discr) + z_offset
-        return np.round(z_coors_of_cantitip, decimals=3)
+        self._validate_int(discr, 'discr')
+        self._validate_int(edge, 'edge')
+        if self._is_rectangular:
+            return self._z_rounded(discr)
+        #  edge 1 lies canti_l before the first girder, edge 2 the full deck width past it
+        canti_dist = -self.canti_l if edge == 1 else \
+            self.canti_l + (self.no_of_beams -1) * self.beam_spacing
+        z_coors_of_cantitip = self._z_base(discr) + canti_dist * self._cot_skew
+        return np.round(z_coors_of_cantitip, decimals=3, out=z_coors_of_cantitip)
     
     def _z_coors_cross_m(self, discr=20, x_dist=4.0):
         """returns numpy array of z cooridnates of lingitudal arbitrary line (z-line) governing nodes"""
-        if isinstance(discr, int) == False:
-            raise TypeError(f"discr must be an integer!")
-        if isinstance(x_dist, float) == False and isinstance(x_dist, int) == False:
-            raise TypeError(f"x_dist must be a float or integer!")
-        if self.skew == 90 or x_dist == 0.0:
-            _z_coors_cross_m = self._z_coors_in_g1(discr)
-        else:
-            rad_skew = math.radians(self.skew) 
-            z_offset = x_dist * (1 / math.tan(rad_skew))
-            _z_coors_cross_m = self._z_coors_in_g1(discr) + z_offset
-        return np.round(_z_coors_cross_m, decimals=3)
+        self._validate_int(discr, 'discr')
+        self._validate_number(x_dist, 'x_dist')
+        if self._is_rectangular or x_dist == 0.0:
+            return self._z_rounded(discr)
+        z_offset = x_dist * self._cot_skew
+        _z_coors_cross_m = self._z_base(discr) + z_offset
+        return np.round(_z_coors_cross_m, decimals=3, out=_z_coors_cross_m)
     
     def _x_coors_in_g1(self, discr=20):
         """returns numpy array of x coordinates in first girder"""
-        if isinstance(discr, int) == False:
-            raise TypeError(f"discr must be an integer!")
-        x_coors_in_g1 = np.array([0.0])
-        for j in range(self.span_data[0]):
-            x_local = 0.0
-            for i in range(discr):
-                x_coors_in_g1 = np.append(x_coors_in_g1, [x_local])
-        return np.round(x_coors_in_g1, decimals=3)
+        self._validate_int(discr, 'discr')
+        return np.zeros(self.span_data[0] * discr + 1, dtype=self.coor_dtype)
     
     def _x_coors_cross_m(self, discr=20, x_dist=4.0):
         """returns numpy array of x cooridnates of lingitudal arbitrary line (z-line) governing nodes"""
-        if isinstance(discr, int) == False:
-            raise TypeError(f"discr must be an integer!")
-        if isinstance(x_dist, float) == False and isinstance(x_dist, int) == False:
-            raise TypeError(f"x_dist must be a float or integer!")
+        self._validate_int(discr, 'discr')
+        self._validate_number(x_dist, 'x_dist')
         x_coors_cross_m = self._x_coors_in_g1(discr) + x_dist
         return np.round(x_coors_cross_m, decimals=3)
         
     
     def _x_coors_in_g(self, discr=20, gird_no=2):
         """returns numpy array of x coordinates in given girder"""
-        if isinstance(discr, int) == False:
-            raise TypeError(f"discr must be an integer!")
+        self._validate_int(discr, 'discr')
         x_coors_in_g = self._x_coors_in_g1(discr) + (gird_no-1) * self.beam_spacing
         return np.round(x_coors_in_g, decimals=3)
     
     def _x_coors_of_cantitip(self, discr=20, edge=1):
         """returns numpy array of x cooridnates of cantilever tips"""
-        if isinstance(discr, int) == False:
-            raise TypeError(f"discr must be an integer!")
-        if isinstance(edge, int) == False:
-            raise TypeError(f"edge must be an integer!")
+        self._validate_int(discr, 'discr')
+        self._validate_int(edge, 'edge')
         if edge == 1:
             x_coors_of_cantitip = self._x_coors_in_g1(discr) - self.canti_l
         else:
@@ -119,6 +139,26 @@ class Grilladge(FEModel3D):
         return np.round(x_coors_of_cantitip, decimals=3)
     
 
+    @staticmethod
+    def _offset_lines(base_line, offsets):
+        """returns one row per offset holding the base line shifted by it - the rows are
+        disjoint, so the whole grid comes from a single broadcast"""
+        lines = base_line + np.asarray(offsets)[:, None]
+        #  rounding in place spares a second full-size allocation
+        return np.round(lines, decimals=3, out=lines)
+
+    def _all_z_coors(self, discr=20):
+        """returns 2D numpy array of z coordinates of all girders, one row per girder"""
+        self._validate_int(discr, 'discr')
+        z_offsets = np.arange(self.no_of_beams) * self.beam_spacing * self._cot_skew
+        return self._offset_lines(self._z_base(discr), z_offsets)
+
+    def _all_x_coors(self, discr=20):
+        """returns 2D numpy array of x coordinates of all girders, one row per girder"""
+        self._validate_int(discr, 'discr')
+        x_offsets = np.arange(self.no_of_beams) * self.beam_spacing
+        return self._offset_lines(self._x_coors_in_g1(discr), x_offsets)
+
     def _nodes_coor_g(self, discr=20):
         """
         Aggregartes all nodes coordinates of girders
@@ -135,17 +175,11 @@ class Grilladge(FEModel3D):
         -------
         coordinates of nodes in numpy array
         """
-        if isinstance(discr, int) == False:
-            raise TypeError(f"discr must be an integer!")
-        
-        z_coors_g = np.array([])
-        x_coors_g = np.array([])
-        for i in range(self.no_of_beams):
-            z_in_g = self._z_coors_in_g(discr=discr, gird_no=i+1)
-            z_coors_g = np.append(z_coors_g, [z_in_g])
-            x_in_g = self._x_coors_in_g(discr, i+1)
-            x_coors_g = np.append(x_coors_g, [x_in_g])
+        self._validate_int(discr, 'discr')
         
+        #  one broadcast per direction builds the coordinates of every girder at once
+        z_coors_g = self._all_z_coors(discr).ravel()
+        x_coors_g = self._all_x_coors(discr).ravel()
         y_coors_g = np.zeros(self.no_of_beams * self.span_data[0] * discr + self.no_of_beams)
         # self._z_coors_of_cantitip(self, discr=20, edge=1)
         # self._x_coors_in_g(self, discr=20, gird_no=2)
@@ -159,14 +193,10 @@ class Grilladge(FEModel3D):
     
     def _gen_coor_array(self, discr, x_dist_array):
         """generates three numpy arraayes with z, x and y coordinates"""
-        z_coors = np.array([])
-        x_coors = np.array([])
-        y_coors = np.array([])
-        for x_dist in x_dist_array:
-            z_in_g = self._z_coors_cross_m(discr=discr, x_dist=x_dist)
-            z_coors = np.append(z_coors, [z_in_g])
-            x_in_g = self._x_coors_cross_m(discr, x_dist=x_dist)
-            x_coors = np.append(x_coors, [x_in_g])
+        x_dist_array = np.asarray(x_dist_array, dtype=np.float64)
+        #  broadcasting the first girder line against the x distances builds every line at once
+        z_coors = self._offset_lines(self._z_base(discr), x_dist_array * self._cot_skew).ravel()
+        x_coors = self._offset_lines(self._x_coors_in_g1(discr), x_dist_array).ravel()
         y_coors = np.zeros(len(x_dist_array) * self.span_data[0] * discr + len(x_dist_array))
         return z_coors, x_coors, y_coors
     
@@ -192,9 +222,7 @@ class Grilladge(FEModel3D):
         if isinstance(discr, int) == False or isinstance(tr_discr, int) == False:
             raise TypeError(f"discr and tr_discr must be an integer!")
         #  generating girder nodes coordinates:
-        x_dist_arr_g = np.array([])
-        for i in range(self.no_of_beams):
-            x_dist_arr_g = np.append(x_dist_arr_g, [i * self.beam_spacing])
+        x_dist_arr_g = np.arange(self.no_of_beams, dtype=np.float64) * self.beam_spacing
         z_coors_g, x_coors_g, y_coors_g = self._gen_coor_array(discr, x_dist_arr_g)
         all_nodes_coor_g = np.stack((z_coors_g, x_coors_g, y_coors_g))
         
@@ -204,15 +232,71 @@ class Grilladge(FEModel3D):
         all_nodes_coor_c = np.stack((z_coors_c, x_coors_c, y_coors_c))
         
         #  generating cross member nodes coordinates:
-        x_dist_arr_cr = np.array([])
-        for i in range(self.no_of_beams-1):
-            for j in range(tr_discr-1):
-                x_dist_arr_cr = np.append(x_dist_arr_cr, [(j+1) * self.beam_spacing / tr_discr])
+        x_dist_arr_cr = np.tile(np.arange(1, tr_discr) * self.beam_spacing / tr_discr,
+                                self.no_of_beams-1)
         print(x_dist_arr_cr)
         z_coors_cr, x_coors_cr, y_coors_cr = self._gen_coor_array(discr, x_dist_arr_cr)
         all_nodes_coor_cr = np.stack((z_coors_cr, x_coors_cr, y_coors_cr))
         return all_nodes_coor_g, all_nodes_coor_c, all_nodes_coor_cr
 
+    def bulk_add_nodes(self, x_coors, y_coors, z_coors, name_prefix='N'):
+        """
+        Adds a batch of nodes to the model in one pass.
+
+        Parameters
+        ----------
+        x_coors, y_coors, z_coors : numpy arrays
+            global coordinates of the nodes to add, in matching order
+        name_prefix : string
+            prefix for the generated node names; nodes are numbered from the
+            current node count upward
+        Raises
+        ------
+        NameError
+            Occurs when a generated name already exists in the model.
+        Returns
+        -------
+        list of the names of the added nodes
+        """
+        start = len(self.Nodes)
+        names = [f'{name_prefix}{start + i}' for i in range(len(x_coors))]
+        for name in names:
+            if name in self.Nodes:
+                raise NameError(f"Node name '{name}' already exists")
+        nodes = Node3D.from_arrays(names, x_coors, y_coors, z_coors)
+        #  one dict update avoids the per-call overhead of add_node
+        self.Nodes.update(zip(names, nodes))
+        return names
+
+    def compute_all(self, discr=20):
+        """
+        Computes every coordinate family of the grilladge in one call.
+
+        All families derive from the cached first-girder line, so the base coordinates are only
+        computed once and each variant is a single broadcast off it.
+
+        Parameters
+        ----------
+        discr : integer
+            number of desired finite elements in each girder in each span.
+        Raises
+        ------
+        TypeError
+            Occurs when the 'discr' is not integer.
+        Returns
+        -------
+        dictionary with the first-girder, all-girder and cantilever tip coordinate arrays
+        """
+        self._validate_int(discr, 'discr')
+        return {'z_g1': self._z_coors_in_g1(discr),
+                'x_g1': self._x_coors_in_g1(discr),
+                'z_g': self._all_z_coors(discr),
+                'x_g': self._all_x_coors(discr),
+                'z_cantitip_1': self._z_coors_of_cantitip(discr, 1),
+                'z_cantitip_2': self._z_coors_of_cantitip(discr, 2),
+                'x_cantitip_1': self._x_coors_of_cantitip(discr, 1),
+                'x_cantitip_2': self._x_coors_of_cantitip(discr, 2)}
+
     def grilladge_nodes(self):
         """returns nodes of grilladge"""
         return self.Nodes
@@ -220,10 +304,7 @@ class Grilladge(FEModel3D):
 
 def main():
     wd185 = Grilladge(no_of_beams=2, beam_spacing=8, span_data=(2, 30, 30), skew=80)
-    # print(wd185._z_coors_of_cantitip(discr=10, edge=2))
-    # print(wd185._z_coors_in_g(discr=10, gird_no=2))
-    # print(wd185._x_coors_in_g1(discr=10))
-    # print(wd185._x_coors_in_g(discr=10, gird_no=2))
+    print(wd185.compute_all(discr=10))
     print(wd185._nodes_coor(discr=2, tr_discr=3))
     
 if __name__ == '__main__':